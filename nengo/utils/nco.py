@@ -33,6 +33,7 @@ order as each one gives the start of the next header (corresponding to the
 end of the array data).
 """
 
+import io
 import os
 import pickle
 import struct
@@ -42,6 +43,8 @@ import numpy as np
 from .cache import byte_align
 from ..exceptions import CacheIOError
 
+READLINE_BLOCK_SIZE = 4096
+
 
 class Subfile:
     """A file-like object for limiting reads to a subrange of a file.
@@ -64,40 +67,85 @@ class Subfile:
         self.end = end
         self.max_size = end - start
 
-        self.fileobj.seek(start)
+        # For binary files backed by a file descriptor, reads are done with a
+        # single os.pread instead of a seek/read pair, halving the syscall
+        # count and keeping the position local to this Subfile.
+        self._fd = None
+        if not isinstance(fileobj, io.TextIOBase):
+            try:
+                self._fd = fileobj.fileno()
+            except (AttributeError, OSError, io.UnsupportedOperation):
+                pass
+
+        if self._fd is None:
+            self.fileobj.seek(start)
+        else:
+            self._pos = 0
 
     def read(self, size=None):
+        if self._fd is not None:
+            size = min(size, self.max_size) if size is not None else self.max_size
+            data = os.pread(self._fd, size, self.start + self._pos)
+            self._pos += len(data)
+            self.max_size -= len(data)
+            return data
         size = min(size, self.max_size) if size is not None else self.max_size
         self.max_size -= size
         return self.fileobj.read(size)
 
     def readline(self, size=None):
         size = min(size, self.max_size) if size is not None else self.max_size
+        if self._fd is not None:
+            # Read in fixed-size blocks so that a window without a newline
+            # does not get pulled into memory all at once.
+            data = b""
+            while len(data) < size:
+                block = os.pread(
+                    self._fd,
+                    min(READLINE_BLOCK_SIZE, size - len(data)),
+                    self.start + self._pos + len(data),
+                )
+                if not block:
+                    break
+                idx = block.find(b"\n")
+                if idx >= 0:
+                    data += block[: idx + 1]
+                    break
+                data += block
+            self._pos += len(data)
+            self.max_size = self.end - self.start - self._pos
+            return data
         data = self.fileobj.readline(size)
         self.max_size = self.end - self.fileobj.tell()
         return data
 
     def seek(self, offset, whence=os.SEEK_SET):
         if whence == os.SEEK_CUR:
-            offset = self.fileobj.tell() + offset
+            offset = self.tell() + offset
         elif whence == os.SEEK_SET:
-            offset = self.start + offset
+            pass
         elif whence == os.SEEK_END:
-            offset = self.end + offset
+            offset = self.end - self.start + offset
         else:
             raise NotImplementedError()
-        offset = max(self.start, min(self.end, offset))
-        self.max_size = self.end - offset
-        self.fileobj.seek(offset)
+        offset = max(0, min(self.end - self.start, offset))
+        self.max_size = self.end - self.start - offset
+        if self._fd is not None:
+            self._pos = offset
+        else:
+            self.fileobj.seek(self.start + offset)
 
     def tell(self):
+        if self._fd is not None:
+            return self._pos
         return self.fileobj.tell() - self.start
 
 
 MAGIC_STRING = "NCO".encode("utf-8")
 SUPPORTED_PROTOCOLS = [0]
 HEADER_FORMAT = "@{}sBLLLL".format(len(MAGIC_STRING))
-HEADER_SIZE = struct.calcsize(HEADER_FORMAT)
+HEADER_STRUCT = struct.Struct(HEADER_FORMAT)
+HEADER_SIZE = HEADER_STRUCT.size
 ALIGNMENT = 16
 
 
@@ -124,8 +172,8 @@ def write(fileobj, metadata, array):
     np.save(fileobj, array)
     array_end = fileobj.tell()
 
-    header = struct.pack(
-        HEADER_FORMAT, MAGIC_STRING, 0, pickle_start, pickle_end, array_start, array_end
+    header = HEADER_STRUCT.pack(
+        MAGIC_STRING, 0, pickle_start, pickle_end, array_start, array_end
     )
     fileobj.seek(start)
     fileobj.write(header)
@@ -147,9 +195,14 @@ def read(fileobj):
         element and the array with the actual data as second element.
     """
     header = fileobj.read(HEADER_SIZE)
-    magic, version, pickle_start, pickle_end, array_start, array_end = struct.unpack(
-        HEADER_FORMAT, header
-    )
+    (
+        magic,
+        version,
+        pickle_start,
+        pickle_end,
+        array_start,
+        array_end,
+    ) = HEADER_STRUCT.unpack(header)
 
     if magic != MAGIC_STRING:
         raise CacheIOError("Not a Nengo cache object file.")
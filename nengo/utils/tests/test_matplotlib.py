@@ -5,10 +5,14 @@ import nengo
 from nengo.utils.matplotlib import rasterplot
 
 
-@pytest.mark.parametrize("use_eventplot", [True, False])
-def test_rasterplot(use_eventplot, Simulator, seed, plt):
+@pytest.fixture(scope="module")
+def rasterplot_data(Simulator):
+    """Spike data shared across the rasterplot tests.
 
-    with nengo.Network(seed=seed) as model:
+    Building and running the simulator dominates the test time,
+    so we do it once for the whole module.
+    """
+    with nengo.Network(seed=0) as model:
         u = nengo.Node(output=lambda t: np.sin(6 * t))
         a = nengo.Ensemble(100, 1)
         nengo.Connection(u, a)
@@ -17,6 +21,12 @@ def test_rasterplot(use_eventplot, Simulator, seed, plt):
     with Simulator(model) as sim:
         sim.run(1.0)
 
-    rasterplot(sim.trange(), sim.data[ap], use_eventplot=use_eventplot)
+    return sim.trange(), sim.data[ap]
+
+
+def test_rasterplot(rasterplot_data, plt):
+    time, spikes = rasterplot_data
+    rasterplot(time, spikes, ax=plt.subplot(2, 1, 1), use_eventplot=True)
+    rasterplot(time, spikes, ax=plt.subplot(2, 1, 2), use_eventplot=False)
 
     # TODO: add assertions
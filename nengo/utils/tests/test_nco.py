@@ -1,105 +1,99 @@
+import io
 import os
 
 import numpy as np
-from numpy.testing import assert_equal
 import pytest
 
 import nengo.utils.nco as nco
 from nengo.utils.nco import Subfile
 
 
-@pytest.fixture
+class InMemoryFile:
+    """Mimics the ``open`` interface of a path, backed by an in-memory copy."""
+
+    def __init__(self, content):
+        self.content = content
+
+    def open(self, mode="rb"):
+        return io.BytesIO(self.content)
+
+
+@pytest.fixture(scope="module")
 def data():
-    return "0123456789\n123456789"
+    return b"0123456789\n123456789"
 
 
-@pytest.fixture
-def testfile(data, tmpdir):
-    f = tmpdir.join("file.txt")
-    f.write(data)
-    return f
+@pytest.fixture(scope="module", params=["disk", "memory"])
+def testfile(request, data, tmp_path_factory):
+    # Runs every Subfile test against both read paths: a real file exercises
+    # the fd-backed os.pread branch, while the in-memory file has no file
+    # descriptor and exercises the seek/read fallback.
+    if request.param == "disk":
+        path = tmp_path_factory.mktemp("nco").joinpath("file.txt")
+        path.write_bytes(data)
+        return path
+    return InMemoryFile(data)
 
 
 class TestSubfile:
     def test_reads_only_from_start_to_end(self, data, testfile):
-        with testfile.open() as f:
+        with testfile.open("rb") as f:
             assert Subfile(f, 2, 6).read() == data[2:6]
-        with testfile.open() as f:
+        with testfile.open("rb") as f:
             assert Subfile(f, 2, 6).read(8) == data[2:6]
-        with testfile.open() as f:
+        with testfile.open("rb") as f:
             assert Subfile(f, 2, 6).readline() == data[2:6]
-        with testfile.open() as f:
+        with testfile.open("rb") as f:
             assert Subfile(f, 2, 6).readline(8) == data[2:6]
 
     def test_respects_read_size(self, data, testfile):
-        with testfile.open() as f:
+        with testfile.open("rb") as f:
             assert Subfile(f, 2, 6).read(2) == data[2:4]
-        with testfile.open() as f:
+        with testfile.open("rb") as f:
             assert Subfile(f, 2, 6).readline(2) == data[2:4]
 
     def test_readline(self, data, testfile):
-        with testfile.open() as f:
+        with testfile.open("rb") as f:
             assert Subfile(f, 2, 14).readline() == data[2:11]
-        with testfile.open() as f:
+        with testfile.open("rb") as f:
             assert Subfile(f, 2, 14).readline(15) == data[2:11]
 
-    def test_seek(self, data, testfile):
-        with testfile.open() as f:
-            sf = Subfile(f, 2, 6)
-            sf.seek(2)
-            assert sf.read() == data[4:6]
-        with testfile.open() as f:
-            sf = Subfile(f, 2, 6)
-            sf.read(1)
-            sf.seek(2, os.SEEK_CUR)
-            assert sf.read() == data[5:6]
-        with testfile.open() as f:
-            sf = Subfile(f, 2, 6)
-            sf.seek(-2, os.SEEK_END)
-            assert sf.read() == data[4:6]
-
-    def test_seek_before_start(self, data, testfile):
-        with testfile.open() as f:
+    @pytest.mark.parametrize(
+        "pre_read, seek_args, expected",
+        [
+            # seeks within bounds
+            (0, (2,), (4, 6)),
+            (1, (2, os.SEEK_CUR), (5, 6)),
+            (0, (-2, os.SEEK_END), (4, 6)),
+            # seeks before start are clamped to the start
+            (0, (-2,), (2, 6)),
+            (1, (-4, os.SEEK_CUR), (2, 6)),
+            (0, (-8, os.SEEK_END), (2, 6)),
+            # seeks after end are clamped to the end
+            (0, (8,), (6, 6)),
+            (1, (8, os.SEEK_CUR), (6, 6)),
+            (0, (8, os.SEEK_END), (6, 6)),
+        ],
+    )
+    def test_seek(self, data, testfile, pre_read, seek_args, expected):
+        with testfile.open("rb") as f:
             sf = Subfile(f, 2, 6)
-            sf.seek(-2)
-            assert sf.read() == data[2:6]
-        with testfile.open() as f:
-            sf = Subfile(f, 2, 6)
-            sf.read(1)
-            sf.seek(-4, os.SEEK_CUR)
-            assert sf.read() == data[2:6]
-        with testfile.open() as f:
-            sf = Subfile(f, 2, 6)
-            sf.seek(-8, os.SEEK_END)
-            assert sf.read() == data[2:6]
-
-    def test_seek_after_end(self, testfile):
-        with testfile.open() as f:
-            sf = Subfile(f, 2, 6)
-            sf.seek(8)
-            assert sf.read() == ""
-        with testfile.open() as f:
-            sf = Subfile(f, 2, 6)
-            sf.read(1)
-            sf.seek(8, os.SEEK_CUR)
-            assert sf.read() == ""
-        with testfile.open() as f:
-            sf = Subfile(f, 2, 6)
-            sf.seek(8, os.SEEK_END)
-            assert sf.read() == ""
+            if pre_read > 0:
+                sf.read(pre_read)
+            sf.seek(*seek_args)
+            assert sf.read() == data[slice(*expected)]
 
 
-def test_nco_roundtrip(tmpdir):
-    tmpfile = tmpdir.join("test.nco")
-
+def test_nco_roundtrip():
     pickle_data = {"0": 237, "str": "foobar"}
     array = np.array([[4, 3], [2, 1]])
 
-    with tmpfile.open("wb") as f:
-        nco.write(f, pickle_data, array)
-
-    with tmpfile.open("rb") as f:
-        pickle_data2, array2 = nco.read(f)
+    buf = io.BytesIO()
+    nco.write(buf, pickle_data, array)
+    buf.seek(0)
+    pickle_data2, array2 = nco.read(buf)
 
     assert pickle_data == pickle_data2
-    assert_equal(array, array2)
+    assert array.shape == array2.shape
+    assert array.dtype == array2.dtype
+    assert array.tobytes() == array2.tobytes()
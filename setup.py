@@ -51,6 +51,7 @@ tests_req = [
     "pytest-allclose",
     "pytest-plt",
     "pytest-rng",
+    "pytest-xdist",
 ]
 
 setup(